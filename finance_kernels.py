@@ -0,0 +1,220 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import math
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # Numba is optional; the kernels run as plain Python without it.
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        return lambda func: np.vectorize(func, otypes=[float])
+
+# =============================================================================
+# Helper Functions for Debt & Investment Calculations
+# =============================================================================
+@vectorize(["float64(float64, float64, float64)"], cache=True)
+def calculate_payoff_months(amount, annual_interest_rate, payment):
+    """
+    Compute the number of months required to pay off a debt given a fixed payment,
+    using the closed-form amortization formula n = -log(1 - B*r/P) / log(1 + r).
+    Returns NaN if the payment never covers the monthly interest. Works element-wise
+    on arrays, so all debts can be evaluated in one call.
+    """
+    monthly_rate = annual_interest_rate / 100 / 12
+    if payment <= amount * monthly_rate:
+        return np.nan
+    if monthly_rate == 0:
+        return math.ceil(amount / payment)
+    return math.ceil(-math.log1p(-amount * monthly_rate / payment) / math.log1p(monthly_rate))
+
+@njit(cache=True)
+def remaining_balance(amount, annual_interest_rate, payment, months):
+    """
+    Calculate remaining balance on a debt after a given number of months using the
+    closed-form loan balance B*(1+r)^m - P*((1+r)^m - 1)/r, floored at zero.
+    `months` may be a NumPy array to get the whole balance trajectory in one call.
+    """
+    monthly_rate = annual_interest_rate / 100 / 12
+    months = np.asarray(months)
+    # The balance is zero from the (fractional) payoff month on, so stop there
+    # instead of raising (1+r) to ever larger powers on long horizons.
+    payoff_month = np.inf
+    if monthly_rate == 0:
+        if payment > 0:
+            payoff_month = amount / payment
+        balance = amount - payment * months
+    else:
+        if payment > amount * monthly_rate:
+            payoff_month = -math.log1p(-amount * monthly_rate / payment) / math.log1p(monthly_rate)
+        growth_minus_one = np.expm1(np.minimum(months, payoff_month) * math.log1p(monthly_rate))
+        balance = amount * (1 + growth_minus_one) - payment * growth_minus_one / monthly_rate
+    # Evaluating at the fractional payoff month leaves float residue, so months at or
+    # past payoff are set to exactly zero.
+    return np.maximum(np.where(months >= payoff_month, 0.0, balance), 0)
+
+@vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+def future_value(current_amount, monthly_contribution, annual_return_rate, months):
+    """
+    Calculate the future value of an investment with fixed monthly contributions
+    using the annuity closed form FV = P*(1+r)^n + C*((1+r)^n - 1)/r. Works
+    element-wise on arrays, so all investments can be evaluated in one call.
+    
+    (1+r)^n - 1 is computed as expm1(n*log1p(r)) to avoid cancellation at small
+    monthly rates; the other closed forms in this module use the same idiom.
+    """
+    r = annual_return_rate / 100 / 12
+    if r == 0:
+        return current_amount + monthly_contribution * months
+    growth_minus_one = math.expm1(months * math.log1p(r))
+    return current_amount * (1 + growth_minus_one) + monthly_contribution * growth_minus_one / r
+
+def explicit_investment_totals(explicit_investments, horizon_months):
+    """
+    Calculate the combined value of all explicit investments for every month from
+    0 to horizon_months with one future_value call broadcast over (investments x months).
+    
+    Returns an array of length horizon_months + 1.
+    """
+    months = np.arange(horizon_months + 1)
+    return future_value(
+        explicit_investments["Current Amount"][:, None],
+        explicit_investments["Monthly Contribution"][:, None],
+        explicit_investments["Return Rate"][:, None],
+        months[None, :]
+    ).sum(axis=0)
+
+# -----------------------------------------------------------------------------
+# Compiled Kernel: Month-by-Month Debt Allocation
+# -----------------------------------------------------------------------------
+@njit(cache=True)
+def simulate_debt_core(balances, min_payments, growth, order, debt_allocation, n_months):
+    """
+    Apply n_months of payments to the debts. Each month the active debts receive their
+    minimums (pro-rated if debt_allocation can't cover them) and any extra goes to the
+    debts in `order` (descending interest rate). `growth` holds each debt's monthly
+    interest factor 1 + r.
+    
+    Returns (total_debt, total_payments, payoff_months): the remaining balance and
+    amount paid after each month, and for each debt the number of payments after which
+    it reached zero (0 if it never did).
+    """
+    n_debts = balances.shape[0]
+    balances = balances.copy()
+    payments = np.zeros(n_debts)
+    accrued = np.zeros(n_debts)
+    total_debt = np.zeros(n_months)
+    total_payments = np.zeros(n_months)
+    payoff_months = np.zeros(n_debts, dtype=np.int64)
+    for m in range(n_months):
+        total_min = 0.0
+        any_active = False
+        for i in range(n_debts):
+            payments[i] = 0.0
+            if balances[i] > 0:
+                # Balance with this month's interest, shared by the allocation and update.
+                accrued[i] = balances[i] * growth[i]
+                total_min += min_payments[i]
+                any_active = True
+        # Once everything is paid off the remaining months stay at zero.
+        if not any_active:
+            break
+        if debt_allocation < total_min:
+            scale = debt_allocation / total_min
+            for i in range(n_debts):
+                if balances[i] > 0:
+                    payments[i] = min_payments[i] * scale
+        else:
+            # First pay the minimums...
+            for i in range(n_debts):
+                if balances[i] > 0:
+                    payments[i] = min_payments[i]
+            extra = debt_allocation - total_min
+            # ...then allocate extra to debts in order of descending interest rate.
+            for i in order:
+                if extra <= 0:
+                    break
+                if balances[i] <= 0:
+                    continue
+                extra_payment = min(extra, max(accrued[i] - payments[i], 0.0))
+                payments[i] += extra_payment
+                extra -= extra_payment
+        
+        # Update each debt balance
+        remaining = 0.0
+        paid = 0.0
+        for i in range(n_debts):
+            paid += payments[i]
+            if balances[i] > 0:
+                balances[i] = max(accrued[i] - payments[i], 0.0)
+                if balances[i] == 0:
+                    payoff_months[i] = m + 1
+            remaining += balances[i]
+        total_debt[m] = remaining
+        total_payments[m] = paid
+    return total_debt, total_payments, payoff_months
+
+# -----------------------------------------------------------------------------
+# Simulation Function: Overall Financial Simulation (Month-by-Month)
+# -----------------------------------------------------------------------------
+@st.cache_data(max_entries=256)
+def simulate_finances(debts, explicit_investments, monthly_budget, debt_allocation, horizon_months,
+                      default_return_rate=7.0, payoff_window=120):
+    """
+    Simulate your finances over time with:
+      - monthly_budget: total funds available each month.
+      - debt_allocation: the portion of monthly_budget allocated for debt payments.
+      - investment_allocation = monthly_budget - debt_allocation goes to the default investment.
+    
+    Returns (simulation, payoff_months) from a single pass over the debts:
+      - simulation: a DataFrame indexed by Month with the net worth, total debt,
+        total investments, default investment value, explicit investments value,
+        and total debt payments.
+      - payoff_months: an int array with, for each debt, the number of months until
+        it is paid off, or 0 if that takes longer than payoff_window months.
+    """
+    # Initialize debt parameters
+    balances = np.asarray(debts["Amount Owed"], dtype=float)
+    rates = debts["Interest Rate"] / 100 / 12
+    # Interest rates never change, so the avalanche order and the monthly growth
+    # factors are computed once.
+    order = np.argsort(-rates, kind="stable")
+    growth = 1 + rates
+    explicit_totals = explicit_investment_totals(explicit_investments, horizon_months)
+    
+    # --- Debt Payments and Balances (compiled month loop) ---
+    # Run long enough to cover both the projection and the payoff estimate window.
+    n_months = horizon_months + 1
+    total_debt, debt_payments, payoff_counts = simulate_debt_core(
+        balances, debts["Minimum Payment"], growth, order, float(debt_allocation), max(n_months, payoff_window)
+    )
+    total_debt = total_debt[:n_months]
+    debt_payments = debt_payments[:n_months]
+    payoff_months = np.where(payoff_counts <= payoff_window, payoff_counts, 0)
+    
+    # --- Default Investment ---
+    # It starts at 0 and receives the same allocation every month, even after the
+    # debts are paid off, so its whole series is a geometric sum in closed form.
+    investment_allocation = monthly_budget - debt_allocation
+    default_rate = default_return_rate / 100 / 12
+    months = np.arange(n_months)
+    if default_rate == 0:
+        default_investment = investment_allocation * months.astype(float)
+    else:
+        default_investment = investment_allocation * np.expm1(months * np.log1p(default_rate)) / default_rate
+    
+    # --- Explicit Investments (precomputed closed-form values) ---
+    total_investments = default_investment + explicit_totals
+    simulation = pd.DataFrame({
+        "Net Worth": total_investments - total_debt,
+        "Total Debt": -total_debt,  # displayed as negative
+        "Total Investments": total_investments,
+        "Default Investment": default_investment,
+        "Explicit Investments": explicit_totals,
+        "Debt Payments": debt_payments
+    }, index=pd.RangeIndex(n_months, name="Month"))
+    return simulation, payoff_months